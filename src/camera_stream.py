@@ -2,6 +2,9 @@
 Camera and video stream handling module.
 """
 
+import threading
+import time
+
 import cv2
 import numpy as np
 from typing import Optional, Union
@@ -10,9 +13,14 @@ from typing import Optional, Union
 class CameraStream:
     """
     Manages video input from cameras, video files, or other sources.
-    
+
     Provides a unified interface for accessing different video sources
     with consistent frame retrieval and error handling.
+
+    Live camera frames are grabbed by a background daemon thread into a
+    single latest-frame slot, so capture I/O overlaps with processing
+    and read_frame() always hands back the freshest frame exactly once.
+    File sources are read synchronously so every frame is delivered.
     """
     
     def __init__(self, source: Union[int, str] = 0, width: Optional[int] = None, 
@@ -33,7 +41,17 @@ class CameraStream:
         self.width = width
         self.height = height
         self.is_running = False
-        
+
+        # Latest-frame slot shared between the grab thread and read_frame().
+        # The sequence number guarantees each frame is returned at most once.
+        self._latest: Optional[np.ndarray] = None
+        self._latest_seq = 0
+        self._read_seq = 0
+        self._lock = threading.Lock()
+        self._cond = threading.Condition(self._lock)
+        self._stop_event = threading.Event()
+        self._grab_thread: Optional[threading.Thread] = None
+
     def start(self) -> bool:
         """
         Open and start the video stream.
@@ -42,35 +60,124 @@ class CameraStream:
             bool: True if stream started successfully, False otherwise
         """
         self.capture = cv2.VideoCapture(self.source)
-        
+
         if not self.capture.isOpened():
             return False
-        
+
+        # For live cameras, shrink the driver-side queue so read() returns the
+        # freshest sensor frame instead of a stale buffered one, and request
+        # MJPG since many USB cameras only reach full FPS with compressed
+        # transfer. Some backends silently ignore these hints.
+        if isinstance(self.source, int):
+            try:
+                self.capture.set(cv2.CAP_PROP_BUFFERSIZE, 1)
+                self.capture.set(cv2.CAP_PROP_FOURCC, cv2.VideoWriter_fourcc(*'MJPG'))
+            except cv2.error:
+                pass
+
         # Set resolution if specified
         if self.width is not None:
             self.capture.set(cv2.CAP_PROP_FRAME_WIDTH, self.width)
         if self.height is not None:
             self.capture.set(cv2.CAP_PROP_FRAME_HEIGHT, self.height)
-            
+
         self.is_running = True
+        self._stop_event.clear()
+        # Only live cameras get the grab thread: they produce frames on
+        # their own clock, so overlapping capture with processing and
+        # keeping just the latest frame is the right trade. File sources
+        # produce frames as fast as they are read — an unpaced grab loop
+        # would race through the file and the latest-frame slot would
+        # drop nearly all of it — so files are read synchronously in
+        # read_frame and deliver every frame.
+        if isinstance(self.source, int):
+            self._grab_thread = threading.Thread(target=self._grab_loop, daemon=True)
+            self._grab_thread.start()
         return True
-    
-    def read_frame(self) -> Optional[np.ndarray]:
+
+    def _grab_loop(self) -> None:
         """
-        Read a single frame from the stream.
-        
+        Continuously read frames into the latest-frame slot.
+
+        Runs on a daemon thread so capture I/O and decode overlap with the
+        consumer's processing. Older frames are simply overwritten (LIFO
+        slot), keeping end-to-end latency at roughly one frame.
+        """
+        while not self._stop_event.is_set():
+            ret, frame = self._read_latest()
+            if not ret:
+                # Signal end-of-stream by waking any waiting reader.
+                with self._cond:
+                    self._stop_event.set()
+                    self._cond.notify_all()
+                return
+
+            with self._cond:
+                self._latest = frame
+                self._latest_seq += 1
+                self._cond.notify_all()
+
+    def _read_latest(self) -> tuple[bool, Optional[np.ndarray]]:
+        """
+        Grab frames until the driver queue is drained, then decode one.
+
+        Some backends ignore CAP_PROP_BUFFERSIZE and still queue frames.
+        grab() is far cheaper than retrieve() because it skips decoding,
+        so we drain with grab() and use its timing to detect the newest
+        frame: a slow grab means we actually waited on the camera rather
+        than popping a buffered frame. Only that last frame is decoded.
+
         Returns:
-            np.ndarray: Frame from video stream, or None if read failed
+            tuple[bool, np.ndarray | None]: (success, decoded frame)
+        """
+        half_frame_period = 0.5 / self.get_fps()
+        while True:
+            start = time.perf_counter()
+            if not self.capture.grab():
+                return False, None
+            if time.perf_counter() - start > half_frame_period:
+                break  # Slow grab => waited on the camera => this is newest
+
+        return self.capture.retrieve()
+
+    def read_frame(self, timeout: float = 1.0) -> Optional[np.ndarray]:
+        """
+        Read the most recent frame from the stream.
+
+        For live cameras, blocks until the grab thread delivers a frame
+        that has not been returned before, so consumers never process
+        the same frame twice. A slow camera (exposure change, USB stall)
+        just makes this call wait longer; None means the stream has
+        actually ended or been stopped, never "no frame yet". File
+        sources are read synchronously, one frame per call, so no frame
+        of the file is skipped.
+
+        Args:
+            timeout (float): Granularity of the condition wait while
+                blocking for a camera frame; not a deadline
+
+        Returns:
+            np.ndarray: Frame from video stream, or None once the
+                stream has ended
         """
         if not self.is_running or self.capture is None:
             return None
-        
-        ret, frame = self.capture.read()
-        
-        if not ret:
-            return None
-            
-        return frame
+
+        if self._grab_thread is None:
+            # Synchronous file-source path.
+            ret, frame = self.capture.read()
+            return frame if ret else None
+
+        with self._cond:
+            while self._latest_seq == self._read_seq:
+                if self._stop_event.is_set():
+                    return None
+                # Re-check the stop flag periodically; a timed-out wait
+                # is not end-of-stream, so keep waiting for the camera.
+                self._cond.wait(timeout)
+
+            self._read_seq = self._latest_seq
+            return self._latest
     
     def get_fps(self) -> float:
         """
@@ -121,6 +228,12 @@ class CameraStream:
     
     def stop(self) -> None:
         """Release the video stream and cleanup resources."""
+        self._stop_event.set()
+        with self._cond:
+            self._cond.notify_all()
+        if self._grab_thread is not None:
+            self._grab_thread.join(timeout=1.0)
+            self._grab_thread = None
         if self.capture is not None:
             self.capture.release()
             self.capture = None
@@ -4,6 +4,7 @@ Configuration management for motion extraction.
 
 import json
 from pathlib import Path
+from types import SimpleNamespace
 from typing import Any, Dict
 
 
@@ -44,6 +45,7 @@ class Config:
         self.config_path = Path(config_path)
         self.settings = self.DEFAULTS.copy()
         self.load()
+        self._rebuild_namespaces()
     
     def load(self) -> None:
         """
@@ -74,6 +76,17 @@ class Config:
         for section, values in user_settings.items():
             if section in self.settings:
                 self.settings[section].update(values)
+
+    def _rebuild_namespaces(self) -> None:
+        """
+        Expose each settings section as an attribute namespace.
+
+        Attribute access (config.camera.source) is a single C-level lookup,
+        cheaper than the chained dict lookups of get(), which matters for
+        values read from per-frame callbacks.
+        """
+        for section, values in self.settings.items():
+            setattr(self, section, SimpleNamespace(**values))
     
     def save(self) -> None:
         """Save current settings to file."""
@@ -107,3 +120,4 @@ class Config:
         if section not in self.settings:
             self.settings[section] = {}
         self.settings[section][key] = value
+        self._rebuild_namespaces()
@@ -28,12 +28,17 @@ class ControlsManager:
         # Default max: 10 seconds worth of frames
         self.max_delay = max_delay if max_delay is not None else fps * 10
         
+        # Formatted display text is cached because the delay only changes on
+        # user input, while get_display_text is called every frame.
+        self._cached_text: Optional[str] = None
+
         self.delay_frames = initial_delay_frames
         self._clamp_delay()
-    
+
     def _clamp_delay(self) -> None:
         """Ensure delay stays within valid range."""
         self.delay_frames = max(self.min_delay, min(self.delay_frames, self.max_delay))
+        self._cached_text = None
     
     def increase_delay(self, amount: int = 1) -> None:
         """
@@ -91,5 +96,7 @@ class ControlsManager:
         Returns:
             str: Formatted display text showing current delay
         """
-        seconds = self.get_delay_seconds()
-        return f"Delay: {self.delay_frames} frames ({seconds:.1f}s)"
+        if self._cached_text is None:
+            seconds = self.get_delay_seconds()
+            self._cached_text = f"Delay: {self.delay_frames} frames ({seconds:.1f}s)"
+        return self._cached_text
@@ -34,6 +34,27 @@ class DisplayOverlay:
         self.text_color = (255, 255, 255)  # White
         self.bg_color = (0, 0, 0)  # Black
         self.highlight_color = (0, 255, 255)  # Yellow
+
+        # Persistent background tile reused for the box blend so no
+        # full-size array is allocated per frame.
+        self._bg_tile = np.zeros((1, 1, 3), dtype=np.uint8)
+
+        # The delay readout has a fixed format, so measure its maximum
+        # extent once and skip per-frame getTextSize calls for it.
+        (width, height), baseline = cv2.getTextSize(
+            "Delay: 9999 frames (999.9s)", self.font,
+            self.font_scale, self.font_thickness
+        )
+        self._delay_text_extent = (width, height, baseline)
+
+        # Scratch frame reused across render calls so the overlay never
+        # allocates a fresh full-frame buffer per frame.
+        self._scratch: np.ndarray = None
+
+        # Pre-rasterized text tiles. putText walks Hershey stroke curves on
+        # every call, but the overlay strings only change on user input, so
+        # render each distinct (text, color) once and blit the cached tile.
+        self._text_tiles = {}
     
     def add_text_with_background(self, frame: np.ndarray, text: str, 
                                   position: Tuple[int, int],
@@ -49,29 +70,96 @@ class DisplayOverlay:
         """
         if color is None:
             color = self.text_color
-        
-        # Get text size for background box
-        (text_width, text_height), baseline = cv2.getTextSize(
-            text, self.font, self.font_scale, self.font_thickness
-        )
-        
+
+        # Get text size for the background box. The delay readout (drawn in
+        # the highlight color) has a fixed format, so use its precomputed
+        # maximum extent instead of measuring every frame.
+        if color is self.highlight_color:
+            text_width, text_height, baseline = self._delay_text_extent
+        else:
+            (text_width, text_height), baseline = cv2.getTextSize(
+                text, self.font, self.font_scale, self.font_thickness
+            )
+
         x, y = position
         padding = 5
-        
-        # Create background rectangle coordinates
-        box_coords = (
-            (x - padding, y - text_height - padding),
-            (x + text_width + padding, y + baseline + padding)
-        )
-        
-        # Draw semi-transparent background
-        overlay = frame.copy()
-        cv2.rectangle(overlay, box_coords[0], box_coords[1], self.bg_color, -1)
-        cv2.addWeighted(overlay, self.bg_opacity, frame, 1 - self.bg_opacity, 0, frame)
-        
-        # Draw text
-        cv2.putText(frame, text, position, self.font, self.font_scale,
-                   color, self.font_thickness, cv2.LINE_AA)
+
+        # Background rectangle, clamped to the frame bounds
+        x1 = max(0, x - padding)
+        y1 = max(0, y - text_height - padding)
+        x2 = min(frame.shape[1], x + text_width + padding)
+        y2 = min(frame.shape[0], y + baseline + padding)
+
+        # Blend only the box region instead of copying and re-blending the
+        # whole frame: memory traffic scales with the box, not the frame.
+        if x2 > x1 and y2 > y1:
+            roi = frame[y1:y2, x1:x2]
+            if self._bg_tile.shape[:2] != roi.shape[:2]:
+                self._bg_tile = np.empty_like(roi)
+                self._bg_tile[:] = self.bg_color
+            cv2.addWeighted(self._bg_tile, self.bg_opacity, roi,
+                            1 - self.bg_opacity, 0, dst=roi)
+
+        # Blit the pre-rasterized glyphs instead of re-walking Hershey
+        # stroke curves through putText every frame.
+        self._blit_text(frame, text, position, color)
+
+    def _get_text_tile(self, text: str, color: Tuple[int, int, int]):
+        """
+        Return (tile, mask) for a rasterized text string, rendering once.
+
+        Args:
+            text (str): Text to rasterize
+            color (tuple): Text color in BGR
+
+        Returns:
+            tuple: (BGR tile ndarray, boolean glyph mask ndarray)
+        """
+        key = (text, color)
+        tile_and_mask = self._text_tiles.get(key)
+        if tile_and_mask is None:
+            # Keep the cache bounded; overlay strings cycle through a small
+            # set, so dropping everything on overflow is harmless.
+            if len(self._text_tiles) > 64:
+                self._text_tiles.clear()
+
+            (width, height), baseline = cv2.getTextSize(
+                text, self.font, self.font_scale, self.font_thickness
+            )
+            tile = np.zeros((height + baseline, max(1, width), 3), dtype=np.uint8)
+            cv2.putText(tile, text, (0, height), self.font, self.font_scale,
+                        color, self.font_thickness, cv2.LINE_AA)
+            mask = np.repeat(tile.any(axis=2, keepdims=True), 3, axis=2)
+            tile_and_mask = (tile, mask, height)
+            self._text_tiles[key] = tile_and_mask
+        return tile_and_mask
+
+    def _blit_text(self, frame: np.ndarray, text: str,
+                   position: Tuple[int, int],
+                   color: Tuple[int, int, int]) -> None:
+        """
+        Copy a cached text tile onto the frame at the given baseline origin.
+
+        Args:
+            frame (np.ndarray): Frame to draw on (modified in-place)
+            text (str): Text to display
+            position (tuple): (x, y) position for bottom-left of text
+            color (tuple): Text color in BGR
+        """
+        tile, mask, text_height = self._get_text_tile(text, color)
+        x, y = position
+        y_top = y - text_height
+
+        tile_h, tile_w = tile.shape[:2]
+        x1, y1 = max(0, x), max(0, y_top)
+        x2 = min(frame.shape[1], x + tile_w)
+        y2 = min(frame.shape[0], y_top + tile_h)
+        if x2 <= x1 or y2 <= y1:
+            return
+
+        tile_view = tile[y1 - y_top:y2 - y_top, x1 - x:x2 - x]
+        mask_view = mask[y1 - y_top:y2 - y_top, x1 - x:x2 - x]
+        np.copyto(frame[y1:y2, x1:x2], tile_view, where=mask_view)
     
     def render_bottom_info(self, frame: np.ndarray, delay_text: str,
                           camera_name: str = "") -> np.ndarray:
@@ -89,9 +177,13 @@ class DisplayOverlay:
         Returns:
             np.ndarray: Frame with overlay rendered
         """
-        # Work on a copy to avoid modifying original
-        display_frame = frame.copy()
-        
+        # Render into a reused scratch buffer rather than allocating a copy
+        # of the frame on every call; the input stays unmodified.
+        if self._scratch is None or self._scratch.shape != frame.shape:
+            self._scratch = np.empty_like(frame)
+        np.copyto(self._scratch, frame)
+        display_frame = self._scratch
+
         height = frame.shape[0]
         
     # Camera name overlay intentionally removed; UI now shows it via status bar.
@@ -0,0 +1,302 @@
+"""
+Optional Numba-accelerated kernels for the motion extraction hot path.
+
+The OpenCV implementation of extract_motion chains several full-frame
+passes (invert, blend, absdiff, grayscale, threshold, mask, blend); each
+one reads and writes the whole image, so the stage is memory-bound. The
+fused kernel here computes the same result in a single pass per pixel.
+
+Numba is an optional dependency: when it is not installed, HAVE_NUMBA is
+False and callers fall back to the OpenCV pipeline.
+"""
+
+import numpy as np
+
+try:
+    from numba import njit, prange
+    HAVE_NUMBA = True
+except ImportError:  # pragma: no cover - exercised on hosts without numba
+    HAVE_NUMBA = False
+
+
+if HAVE_NUMBA:
+
+    # No cache=True: this module is importable both flat (from src/) and as
+    # src.motion_kernels, and numba's on-disk cache keys the module name,
+    # failing to load under the other import path.
+    @njit(fastmath=True, inline='always')
+    def _fuse_row(current, delayed, alpha_q, thresh, out, row, width):
+        """Per-row body shared by the generic and shape-specialized kernels.
+
+        alpha_q is the blend factor quantized to Q8.8 fixed point
+        (alpha * 256, rounded): the highlight add becomes an integer
+        multiply-shift that LLVM vectorizes as packed 16-bit ops, with no
+        int-float-int round trip per pixel. For alphas expressible in
+        1/256 steps this matches the float math exactly; otherwise it is
+        within one count.
+        """
+        for col in range(width):
+            d0 = np.int32(current[row, col, 0]) - np.int32(delayed[row, col, 0])
+            d1 = np.int32(current[row, col, 1]) - np.int32(delayed[row, col, 1])
+            d2 = np.int32(current[row, col, 2]) - np.int32(delayed[row, col, 2])
+            if d0 < 0:
+                d0 = -d0
+            if d1 < 0:
+                d1 = -d1
+            if d2 < 0:
+                d2 = -d2
+
+            # BGR channel order: luminance = 0.299R + 0.587G + 0.114B,
+            # rounded like cvtColor's fixed-point path.
+            gray = np.int32(0.114 * d0 + 0.587 * d1 + 0.299 * d2 + 0.5)
+            moving = gray > thresh
+
+            for channel in range(3):
+                c = np.int32(current[row, col, channel])
+                p = np.int32(delayed[row, col, channel])
+                base = (c + 255 - p) >> 1
+                if moving:
+                    if channel == 0:
+                        diff = d0
+                    elif channel == 1:
+                        diff = d1
+                    else:
+                        diff = d2
+                    value = base + ((diff * alpha_q + 128) >> 8)
+                else:
+                    value = base
+                if value > 255:
+                    value = 255
+                out[row, col, channel] = np.uint8(value)
+
+    @njit(parallel=True, fastmath=True)
+    def fuse_motion(current, delayed, alpha, thresh, out):
+        """
+        Single-pass equivalent of the OpenCV motion-extraction chain.
+
+        Per pixel: blend the current frame with the inverted delayed frame
+        at 50% (static regions neutralize to mid-gray), compute the
+        luminance of the frame difference inline, and where it exceeds the
+        threshold add the masked difference scaled by alpha.
+
+        Args:
+            current (uint8 HxWx3): Newest frame (BGR)
+            delayed (uint8 HxWx3): Delayed frame (BGR)
+            alpha (float): Blending factor for the motion highlight
+            thresh (int): Luminance threshold for the motion mask
+            out (uint8 HxWx3): Preallocated output frame
+        """
+        height, width = current.shape[0], current.shape[1]
+        alpha_q = np.int32(alpha * 256.0 + 0.5)
+        for row in prange(height):
+            _fuse_row(current, delayed, alpha_q, thresh, out, row, width)
+
+    @njit(parallel=True, fastmath=True)
+    def fuse_motion_multi(current, delayed_stack, alphas, thresh, out_stack):
+        """
+        Fused extraction against several delay taps in one pass.
+
+        Runs the same per-pixel math as fuse_motion for every tap, but
+        the current frame — the operand shared by all taps — is loaded
+        once per pixel instead of once per tap, so K taps cost one sweep
+        over the current frame plus one over each delayed frame.
+
+        Args:
+            current (uint8 HxWx3): Newest frame (BGR), shared by all taps
+            delayed_stack (uint8 KxHxWx3): One delayed frame per tap
+            alphas (float64 K): Blending factor per tap
+            thresh (int): Luminance threshold for the motion mask
+            out_stack (uint8 KxHxWx3): Preallocated output, one per tap
+        """
+        taps = delayed_stack.shape[0]
+        height, width = current.shape[0], current.shape[1]
+        alphas_q = np.empty(taps, dtype=np.int32)
+        for t in range(taps):
+            alphas_q[t] = np.int32(alphas[t] * 256.0 + 0.5)
+
+        for row in prange(height):
+            for col in range(width):
+                c0 = np.int32(current[row, col, 0])
+                c1 = np.int32(current[row, col, 1])
+                c2 = np.int32(current[row, col, 2])
+                for t in range(taps):
+                    d0 = c0 - np.int32(delayed_stack[t, row, col, 0])
+                    d1 = c1 - np.int32(delayed_stack[t, row, col, 1])
+                    d2 = c2 - np.int32(delayed_stack[t, row, col, 2])
+                    if d0 < 0:
+                        d0 = -d0
+                    if d1 < 0:
+                        d1 = -d1
+                    if d2 < 0:
+                        d2 = -d2
+
+                    gray = np.int32(0.114 * d0 + 0.587 * d1 + 0.299 * d2 + 0.5)
+                    moving = gray > thresh
+                    alpha_q = alphas_q[t]
+
+                    for channel in range(3):
+                        if channel == 0:
+                            c = c0
+                            diff = d0
+                        elif channel == 1:
+                            c = c1
+                            diff = d1
+                        else:
+                            c = c2
+                            diff = d2
+                        p = np.int32(delayed_stack[t, row, col, channel])
+                        value = (c + 255 - p) >> 1
+                        if moving:
+                            value += (diff * alpha_q + 128) >> 8
+                        if value > 255:
+                            value = 255
+                        out_stack[t, row, col, channel] = np.uint8(value)
+
+    def specialize_fuse_motion(height, width, alpha, thresh):
+        """
+        Build a fuse_motion variant with the run's constants baked in.
+
+        The stream runs with one fixed (H, W, 3) shape, one blend factor
+        and one threshold for its lifetime; freezing them all as closure
+        constants gives LLVM known trip counts for both loops and folds
+        the quantized blend factor and threshold into immediates, so the
+        specialized kernel takes no per-call parameters at all.
+        Compilation happens at the first call, so trigger it off the
+        frame loop (see MotionExtractor._specialize_fused).
+
+        Args:
+            height (int): Frame height the kernel is specialized for
+            width (int): Frame width the kernel is specialized for
+            alpha (float): Blend factor, quantized to Q8.8 like fuse_motion
+            thresh (int): Motion mask threshold
+
+        Returns:
+            Compiled kernel(current, delayed, out); it processes exactly
+            height x width pixels regardless of the arrays passed, so
+            only call it with matching frames.
+        """
+        alpha_q = int(round(alpha * 256.0))
+        thresh = int(thresh)
+
+        @njit(parallel=True, fastmath=True)
+        def fuse_motion_fixed(current, delayed, out):
+            for row in prange(height):
+                _fuse_row(current, delayed, alpha_q, thresh, out, row, width)
+
+        return fuse_motion_fixed
+
+    @njit(parallel=True)
+    def blend_invert_avg(current, delayed, out):
+        """
+        Rounded byte average of the current frame and the inverted delayed
+        frame: out = (current + (255 - delayed) + 1) >> 1.
+
+        This fuses the invert and 0.5 blend stages into one
+        read-read-write pass, collapsed into the unsigned-average idiom
+        LLVM recognizes and lowers to the packed byte-average instruction
+        (vpavgb / urhadd) — one instruction per 32 pixels instead of
+        addWeighted's scaled floating-point path. The extraction pipeline
+        itself uses fuse_motion, which folds the remaining stages in as
+        well; this kernel is the standalone two-stage fusion for callers
+        that only need the base blend.
+        Matches cv2.addWeighted(a, 0.5, ~b, 0.5, 0) within 1 LSB: the
+        average idiom rounds halves up while cvRound rounds them to even.
+
+        Args:
+            current (uint8 ndarray): Newest frame, any shape
+            delayed (uint8 ndarray): Delayed frame, same shape
+            out (uint8 ndarray): Preallocated output, same shape
+        """
+        flat_current = current.reshape(-1)
+        flat_delayed = delayed.reshape(-1)
+        flat_out = out.reshape(-1)
+        for i in prange(flat_out.size):
+            inverted = np.uint16(255 - flat_delayed[i])
+            flat_out[i] = np.uint8(
+                (np.uint16(flat_current[i]) + inverted + np.uint16(1)) >> 1
+            )
+
+    @njit(parallel=True)
+    def _threshold_swar_words(words, out_words, thresh):
+        """
+        SWAR byte threshold over 64-bit words.
+
+        Each word compares 8 gray bytes against the threshold at once and
+        writes 8 mask bytes (0x00 or 0xFF). The high bit of every byte is
+        masked off before adding (127 - thresh), so per-byte sums stay
+        below 256 and no carry can leak into a neighboring byte — unlike
+        the borrow-prone "hasless" subtraction trick. A byte's result high
+        bit then reads: low7 + (127 - thresh) >= 128, i.e. low7 > thresh,
+        OR the original high bit was set (byte >= 128 > thresh).
+        """
+        low_bits = np.uint64(0x0101010101010101)
+        high_bits = np.uint64(0x8080808080808080)
+        bias = np.uint64(127 - thresh) * low_bits
+        for i in prange(words.size):
+            word = words[i]
+            above = (((word & ~high_bits) + bias) | word) & high_bits
+            # Spread each per-byte indicator bit to a full 0xFF byte (the
+            # multiply cannot carry across bytes: each holds at most 1).
+            out_words[i] = ((above >> np.uint64(7)) * np.uint64(0xFF))
+
+    def threshold_mask_swar(gray, thresh, out):
+        """
+        Binary-threshold a uint8 image into a 0/255 mask, 8 pixels per op.
+
+        Equivalent to cv2.threshold(gray, thresh, 255, THRESH_BINARY) for
+        thresh <= 127, processing the bulk of the image as packed 64-bit
+        words with a scalar tail for the remainder.
+
+        Args:
+            gray (uint8 ndarray): C-contiguous input image
+            thresh (int): Threshold (0-127)
+            out (uint8 ndarray): Preallocated mask of the same shape
+
+        Raises:
+            ValueError: If thresh is outside 0-127; above 127 the bias
+                word overflows per-byte and the mask would be wrong.
+        """
+        if not 0 <= thresh <= 127:
+            raise ValueError(f"thresh must be 0-127, got {thresh}")
+        flat = gray.reshape(-1)
+        out_flat = out.reshape(-1)
+        word_bytes = (flat.size // 8) * 8
+        if word_bytes:
+            _threshold_swar_words(
+                flat[:word_bytes].view(np.uint64),
+                out_flat[:word_bytes].view(np.uint64),
+                thresh,
+            )
+        for i in range(word_bytes, flat.size):
+            out_flat[i] = 255 if flat[i] > thresh else 0
+
+
+_warmed_up = False
+
+
+def warmup():
+    """
+    Compile the hot-path kernel ahead of the first real frame.
+
+    Numba's AOT facility (numba.pycc) is deprecated and this project has
+    no build step to run it in, so the first call to an @njit kernel
+    would otherwise pay its JIT compilation inside the frame loop — a
+    visible stutter in a real-time GUI. Calling this once at startup
+    (MotionExtractor.__init__ does) triggers compilation on tiny dummy
+    arrays instead; the uint8 signatures match the real frames, so the
+    compiled specializations are reused directly.
+
+    Only fuse_motion — the kernel the extraction pipeline actually
+    calls — is compiled here; the standalone building blocks
+    (blend_invert_avg, threshold_mask_swar) compile lazily on first use
+    so their compile time is never charged to startup.
+
+    A no-op when numba is not installed or warmup already ran.
+    """
+    global _warmed_up
+    if _warmed_up or not HAVE_NUMBA:
+        return
+    _warmed_up = True
+
+    tiny = np.zeros((2, 8, 3), dtype=np.uint8)
+    fuse_motion(tiny, tiny, 0.5, 25, np.empty_like(tiny))
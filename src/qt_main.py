@@ -17,12 +17,12 @@ from qt_window import CameraSettings, MotionSettings, run_app
 def _resolve_initial_delay(config: Config, fps: int) -> Tuple[int, float]:
     """Translate configuration values into frame and second delays."""
 
-    configured_frames = config.get("motion", "delay_frames")
+    configured_frames = config.motion.delay_frames
     if configured_frames is not None:
         frames = int(configured_frames)
         return frames, frames / fps if fps else 0.0
 
-    configured_seconds = config.get("motion", "delay_seconds")
+    configured_seconds = config.motion.delay_seconds
     if configured_seconds is not None:
         seconds = float(configured_seconds)
         return max(0, int(round(seconds * fps))), seconds
@@ -37,21 +37,21 @@ def main() -> int:
     config = Config()
 
     camera_settings = CameraSettings(
-        source=config.get("camera", "source", 0),
-        width=config.get("camera", "width"),
-        height=config.get("camera", "height"),
+        source=config.camera.source,
+        width=config.camera.width,
+        height=config.camera.height,
     )
 
-    fps = int(config.get("motion", "fps", 30)) or 30
+    fps = int(config.motion.fps) or 30
     delay_frames, _ = _resolve_initial_delay(config, fps)
 
     motion_settings = MotionSettings(
         fps=fps,
         delay_frames=delay_frames,
-        blend_alpha=float(config.get("motion", "blend_alpha", 0.5)),
+        blend_alpha=float(config.motion.blend_alpha),
     )
 
-    window_title = config.get("display", "window_name", "Motion Extraction")
+    window_title = config.display.window_name
 
     return run_app(camera_settings, motion_settings, window_title)
 
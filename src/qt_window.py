@@ -8,7 +8,9 @@ preview.
 
 from __future__ import annotations
 
+import os
 import sys
+import time
 from dataclasses import dataclass
 from typing import Optional
 
@@ -52,10 +54,44 @@ class MotionSettings:
     blend_alpha: float
 
 
+class DisplayEncoder(QObject):
+    """Packs motion frames into QImages on its own thread.
+
+    Keeping the QImage construction off the motion worker means the
+    extraction loop never waits on display packaging; the queued signal
+    connection provides the thread hand-off.
+    """
+
+    frame_ready = pyqtSignal(QImage, np.ndarray)
+
+    @pyqtSlot(np.ndarray)
+    def encode(self, frame: np.ndarray) -> None:
+        """Wrap a worker-owned BGR frame in a QImage and forward it."""
+
+        height, width, channel_count = frame.shape
+        image = QImage(
+            frame.data,
+            width,
+            height,
+            channel_count * width,
+            QImage.Format_BGR888,
+        )
+        # The QImage wraps frame's memory without owning it, so the array
+        # rides along in the signal: the queued connection holds the
+        # reference until the GUI slot has copied the pixels, even if the
+        # worker reallocates its emit buffers (e.g. on a window resize).
+        self.frame_ready.emit(image, frame)
+
+
 class MotionExtractorWorker(QObject):
     """Background worker that owns camera capture and motion processing."""
 
-    frame_ready = pyqtSignal(QImage)
+    # Cap on display emissions: each motion_ready crosses a queued
+    # connection, and a camera outpacing the GUI would grow the event
+    # queue without bound. No display gains anything above 60 Hz.
+    DISPLAY_TARGET_FPS = 60
+
+    motion_ready = pyqtSignal(np.ndarray)
     status_message = pyqtSignal(str)
     error_message = pyqtSignal(str)
     fps_detected = pyqtSignal(int)
@@ -79,6 +115,25 @@ class MotionExtractorWorker(QObject):
         self._camera_name = ""
         self._fps = motion_settings.fps
 
+        # Small rotation of persistent frame buffers backing emitted
+        # QImages. Rotating over three slots gives the GUI thread time to
+        # paint one image while the worker fills the next, without the
+        # per-frame allocation of QImage.copy().
+        self._emit_buffers: Optional[list] = None
+        self._emit_index = 0
+
+        # Display target size (video label), updated from the GUI via a
+        # queued slot. Scaling happens here with cv2.resize so the GUI
+        # thread doesn't pay for SmoothTransformation on every repaint.
+        self._target_width = 0
+        self._target_height = 0
+        self._scaled_frame: Optional[np.ndarray] = None
+
+        # Timestamp of the last motion_ready emission, for throttling
+        # display updates to DISPLAY_TARGET_FPS.
+        self._last_emit_ns = 0
+        self._emit_interval_ns = int(1e9 / self.DISPLAY_TARGET_FPS)
+
     @pyqtSlot()
     def run(self) -> None:
         """Begin the capture loop once the worker thread starts."""
@@ -89,6 +144,13 @@ class MotionExtractorWorker(QObject):
         self._running = True
         self.status_message.emit("Starting camera stream...")
 
+        # Let OpenCV's parallel_for_ spread the frame-sized primitives
+        # (addWeighted, absdiff, threshold, ...) over half the cores,
+        # leaving headroom for the GUI thread, and make sure the optimized
+        # SIMD dispatch paths are enabled.
+        cv2.setUseOptimized(True)
+        cv2.setNumThreads(max(1, (os.cpu_count() or 2) // 2))
+
         try:
             self._camera = CameraStream(
                 source=self._camera_settings.source,
@@ -125,6 +187,11 @@ class MotionExtractorWorker(QObject):
             )
 
             while self._running:
+                # CameraStream owns a producer thread feeding a latest-frame
+                # slot; this call blocks until a frame newer than the last
+                # one arrives, so capture overlaps processing, stale frames
+                # are dropped at the source, and no sleep-based pacing is
+                # needed in this loop.
                 frame = self._camera.read_frame()
                 if frame is None:
                     self.status_message.emit("End of stream")
@@ -141,11 +208,18 @@ class MotionExtractorWorker(QObject):
                 if motion_frame is None:
                     continue
 
-                # No overlay - status bar shows all info
-                qt_image = self._convert_to_qimage(motion_frame)
-                self.frame_ready.emit(qt_image)
+                # Throttle display emissions to the GUI's useful repaint
+                # rate; extraction still runs on every frame so the delay
+                # ring stays accurate, only the emit is skipped.
+                now = time.monotonic_ns()
+                if now - self._last_emit_ns < self._emit_interval_ns:
+                    continue
+                self._last_emit_ns = now
 
-                QThread.msleep(1)
+                # No overlay - status bar shows all info. Copy into a
+                # rotated worker-owned buffer and let the encoder thread do
+                # the QImage packaging.
+                self.motion_ready.emit(self._stage_frame(self._fit_to_target(motion_frame)))
 
         except Exception as exc:  # pylint: disable=broad-except
             self.error_message.emit(str(exc))
@@ -164,6 +238,13 @@ class MotionExtractorWorker(QObject):
         self._controls.set_delay_frames(frames)
         self._extractor.update_delay_frames(self._controls.delay_frames)
 
+    @pyqtSlot(int, int)
+    def set_target_size(self, width: int, height: int) -> None:
+        """Record the video label size so frames are scaled worker-side."""
+
+        self._target_width = width
+        self._target_height = height
+
     @pyqtSlot()
     def stop(self) -> None:
         """Signal the capture loop to exit."""
@@ -171,30 +252,62 @@ class MotionExtractorWorker(QObject):
         self._running = False
 
     def _shutdown(self) -> None:
-        """Release camera resources and notify OpenCV."""
+        """Release camera resources."""
 
+        # No cv2.destroyAllWindows() here: this app never creates HighGUI
+        # windows, and the call can race with Qt's event loop on some
+        # platforms.
         if self._camera is not None:
             self._camera.stop()
             self._camera = None
 
-        cv2.destroyAllWindows()
+    def _stage_frame(self, frame: np.ndarray) -> np.ndarray:
+        """Copy a motion frame into the next rotated emit buffer.
 
-    @staticmethod
-    def _convert_to_qimage(frame: np.ndarray) -> QImage:
-        """Convert a BGR OpenCV frame into a QImage copy for display."""
+        The extractor reuses its output buffer, so the frame must be
+        detached before crossing threads; rotating over three persistent
+        slots bounds that to one copy with no per-frame allocation. The
+        buffer is kept alive downstream by the signal connections
+        themselves (DisplayEncoder pairs it with the zero-copy QImage it
+        emits), so dropping old slots here when the shape changes is safe.
+        """
 
-        rgb_frame = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
-        height, width, channel_count = rgb_frame.shape
-        bytes_per_line = channel_count * width
-        image = QImage(
-            rgb_frame.data,
-            width,
-            height,
-            bytes_per_line,
-            QImage.Format_RGB888,
-        )
-        # Copy to detach from the numpy buffer owned by OpenCV.
-        return image.copy()
+        if self._emit_buffers is None or self._emit_buffers[0].shape != frame.shape:
+            self._emit_buffers = [np.empty_like(frame) for _ in range(3)]
+            self._emit_index = 0
+
+        buffer = self._emit_buffers[self._emit_index]
+        self._emit_index = (self._emit_index + 1) % len(self._emit_buffers)
+        np.copyto(buffer, frame)
+        return buffer
+
+    def _fit_to_target(self, frame: np.ndarray) -> np.ndarray:
+        """Scale a motion frame to the display label size, preserving aspect.
+
+        QPixmap.scaled with SmoothTransformation on the GUI thread was
+        the single largest repaint cost; doing the resize here with
+        cv2.resize keeps the GUI handler down to wrapping bytes that are
+        already the right size. Returns the frame unchanged until the
+        window has reported its label size.
+        """
+
+        if self._target_width <= 0 or self._target_height <= 0:
+            return frame
+
+        height, width = frame.shape[:2]
+        scale = min(self._target_width / width, self._target_height / height)
+        out_width = max(1, int(width * scale))
+        out_height = max(1, int(height * scale))
+        if (out_width, out_height) == (width, height):
+            return frame
+
+        if self._scaled_frame is None or self._scaled_frame.shape[:2] != (out_height, out_width):
+            self._scaled_frame = np.empty((out_height, out_width, 3), dtype=frame.dtype)
+
+        interpolation = cv2.INTER_AREA if scale < 1.0 else cv2.INTER_LINEAR
+        cv2.resize(frame, (out_width, out_height), dst=self._scaled_frame,
+                   interpolation=interpolation)
+        return self._scaled_frame
 
 
 class MotionExtractorWindow(QMainWindow):
@@ -249,8 +362,15 @@ class MotionExtractorWindow(QMainWindow):
         self._worker = MotionExtractorWorker(camera_settings, motion_settings, window_title)
         self._worker.moveToThread(self._thread)
 
+        # QImage packaging runs on its own thread so the motion worker
+        # never blocks on display encoding.
+        self._encoder_thread = QThread(self)
+        self._encoder = DisplayEncoder()
+        self._encoder.moveToThread(self._encoder_thread)
+
         self._thread.started.connect(self._worker.run)
-        self._worker.frame_ready.connect(self._update_frame)
+        self._worker.motion_ready.connect(self._encoder.encode)
+        self._encoder.frame_ready.connect(self._update_frame)
         self._worker.status_message.connect(self._handle_status_message)
         self._worker.error_message.connect(self._handle_error)
         self._worker.fps_detected.connect(self._update_fps)
@@ -261,8 +381,16 @@ class MotionExtractorWindow(QMainWindow):
         QShortcut(Qt.CTRL + Qt.Key_Q, self, activated=self.close)
         QShortcut(Qt.Key_Escape, self, activated=self.close)
 
+        self._encoder_thread.start()
         self._thread.start()
 
+    def resizeEvent(self, event) -> None:  # type: ignore[override]
+        """Tell the worker the new label size so it scales frames to fit."""
+
+        super().resizeEvent(event)
+        size = self._video_label.size()
+        self._worker.set_target_size(size.width(), size.height())
+
     def closeEvent(self, event) -> None:  # type: ignore[override]
         """Ensure the worker stops before the window closes."""
 
@@ -271,19 +399,36 @@ class MotionExtractorWindow(QMainWindow):
             self._thread.quit()
             self._thread.wait(2000)
 
+        if self._encoder_thread.isRunning():
+            self._encoder_thread.quit()
+            self._encoder_thread.wait(2000)
+
         super().closeEvent(event)
 
-    @pyqtSlot(QImage)
-    def _update_frame(self, image: QImage) -> None:
-        """Update the QLabel pixmap when the worker emits a new frame."""
+    @pyqtSlot(QImage, np.ndarray)
+    def _update_frame(self, image: QImage, frame: np.ndarray) -> None:
+        """Update the QLabel pixmap when the worker emits a new frame.
+
+        `frame` is the ndarray backing the zero-copy QImage; it is not
+        read here, but holding it until fromImage has copied the pixels
+        keeps the wrapped memory alive.
+        """
 
         pixmap = QPixmap.fromImage(image)
-        scaled = pixmap.scaled(
-            self._video_label.size(),
-            Qt.KeepAspectRatio,
-            Qt.SmoothTransformation,
-        )
-        self._video_label.setPixmap(scaled)
+        label_size = self._video_label.size()
+        if (pixmap.width() <= label_size.width()
+                and pixmap.height() <= label_size.height()):
+            # The worker already scaled the frame to fit the label, so the
+            # expensive SmoothTransformation pass is skipped entirely.
+            self._video_label.setPixmap(pixmap)
+        else:
+            # Frame produced before the worker saw the current label size
+            # (startup or mid-resize); scale it here as a fallback.
+            self._video_label.setPixmap(pixmap.scaled(
+                label_size,
+                Qt.KeepAspectRatio,
+                Qt.SmoothTransformation,
+            ))
 
     @pyqtSlot(int)
     def _update_fps(self, fps: int) -> None:
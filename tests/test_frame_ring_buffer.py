@@ -0,0 +1,124 @@
+"""
+Unit tests for the FrameRingBuffer backing store.
+"""
+
+import pytest
+import numpy as np
+from src.motion_extractor import FrameRingBuffer
+
+
+def _frame(value, shape=(8, 10, 3)):
+    """Build a constant uint8 frame tagged with a value."""
+    return np.full(shape, value % 256, dtype=np.uint8)
+
+
+class TestFrameRingBuffer:
+    """Test suite for append, indexing and wraparound behavior."""
+
+    def test_append_and_length(self):
+        """Test that appends are counted up to capacity."""
+        ring = FrameRingBuffer(maxlen=3)
+        assert len(ring) == 0
+
+        ring.append(_frame(1))
+        assert len(ring) == 1
+
+        for i in range(5):
+            ring.append(_frame(i))
+        assert len(ring) == 3
+
+    def test_indexing_oldest_to_newest(self):
+        """Test that index 0 is the oldest frame and -1 the newest."""
+        ring = FrameRingBuffer(maxlen=4)
+        for i in range(4):
+            ring.append(_frame(i))
+
+        assert ring[0][0, 0, 0] == 0
+        assert ring[-1][0, 0, 0] == 3
+        assert ring[2][0, 0, 0] == 2
+
+    def test_wraparound_overwrites_oldest(self):
+        """Test that appending past capacity drops the oldest frames."""
+        ring = FrameRingBuffer(maxlen=3)
+        for i in range(7):
+            ring.append(_frame(i))
+
+        assert len(ring) == 3
+        assert [ring[i][0, 0, 0] for i in range(3)] == [4, 5, 6]
+
+    def test_index_out_of_range(self):
+        """Test that invalid indices raise IndexError."""
+        ring = FrameRingBuffer(maxlen=3)
+        ring.append(_frame(0))
+
+        with pytest.raises(IndexError):
+            ring[1]
+        with pytest.raises(IndexError):
+            ring[-2]
+
+    def test_stored_frames_are_copies(self):
+        """Test that mutating the caller's frame after append is safe."""
+        ring = FrameRingBuffer(maxlen=2)
+        frame = _frame(5)
+        ring.append(frame)
+        frame.fill(200)
+
+        assert ring[-1][0, 0, 0] == 5
+
+
+class TestFrameRingBufferResize:
+    """Test suite for the block-copy resize against a deque reference."""
+
+    @pytest.mark.parametrize("maxlen,pushes,new_maxlen", [
+        (5, 3, 3),    # shrink before ever wrapping
+        (5, 12, 3),   # shrink after wrapping: retained block wraps too
+        (3, 7, 8),    # grow a wrapped ring
+        (4, 0, 2),    # resize an empty ring
+        (1, 5, 4),    # grow from a single slot
+    ])
+    def test_resize_retains_most_recent(self, maxlen, pushes, new_maxlen):
+        """Test retention order and count against a list reference."""
+        ring = FrameRingBuffer(maxlen=maxlen)
+        for i in range(pushes):
+            ring.append(_frame(i))
+
+        expected = list(range(pushes))[-maxlen:][-new_maxlen:]
+        ring.resize(new_maxlen)
+
+        assert len(ring) == len(expected)
+        assert [ring[i][0, 0, 0] for i in range(len(ring))] == expected
+
+    def test_resize_then_append_continues_correctly(self):
+        """Test that the ring stays consistent after a resize."""
+        ring = FrameRingBuffer(maxlen=5)
+        for i in range(9):
+            ring.append(_frame(i))
+
+        ring.resize(3)
+        ring.append(_frame(50))
+
+        assert len(ring) == 3
+        assert [ring[i][0, 0, 0] for i in range(3)] == [7, 8, 50]
+
+    def test_large_arena_matches_small_path(self):
+        """Test the mmap-backed arena (>2 MB) behaves like the plain one."""
+        # 4 slots of 480x640x3 is ~3.7 MB, crossing the mmap threshold.
+        big = FrameRingBuffer(maxlen=4)
+        small = FrameRingBuffer(maxlen=4)
+        rng = np.random.default_rng(42)
+
+        for i in range(6):
+            frame = rng.integers(0, 256, (480, 640, 3), dtype=np.uint8)
+            big.append(frame)
+            small.append(frame[:8, :10])
+
+        assert len(big) == len(small) == 4
+        assert big._ring.ctypes.data % 64 == 0
+        for i in range(4):
+            assert np.array_equal(big[i][:8, :10], small[i])
+
+        big.resize(2)
+        small.resize(2)
+        assert len(big) == len(small) == 2
+        for i in range(2):
+            assert np.array_equal(big[i][:8, :10], small[i])
@@ -0,0 +1,156 @@
+"""
+Unit tests for MotionExtractor memoization, constant-frame ingest and
+multi-tap extraction.
+"""
+
+import pytest
+import numpy as np
+from src.motion_extractor import MotionExtractor, extract_motion_multi
+from src import motion_kernels
+
+
+def _random_frame(rng, shape=(50, 60, 3)):
+    """Build a random uint8 frame."""
+    return rng.integers(0, 256, shape, dtype=np.uint8)
+
+
+class TestExtractMotionMemoization:
+    """Test suite for the ingest-counter memoization."""
+
+    def test_repeat_polls_return_cached_result(self):
+        """Test that polling without new frames returns the cached object."""
+        rng = np.random.default_rng(0)
+        extractor = MotionExtractor(delay_seconds=0.2, fps=30)
+        for _ in range(5):
+            extractor.add_frame(_random_frame(rng))
+
+        first = extractor.extract_motion()
+        second = extractor.extract_motion()
+
+        assert first is second
+
+    def test_new_frame_invalidates_cache(self):
+        """Test that ingesting a frame forces a recompute."""
+        rng = np.random.default_rng(1)
+        extractor = MotionExtractor(delay_seconds=0.2, fps=30)
+        for _ in range(5):
+            extractor.add_frame(_random_frame(rng))
+
+        before = extractor.extract_motion().copy()
+        extractor.add_frame(_random_frame(rng))
+        after = extractor.extract_motion()
+
+        assert not np.array_equal(before, after)
+
+    def test_update_delay_invalidates_cache(self):
+        """Test that changing the delay recomputes despite no ingest."""
+        rng = np.random.default_rng(2)
+        extractor = MotionExtractor(delay_seconds=0.5, fps=30)
+        for _ in range(16):
+            extractor.add_frame(_random_frame(rng))
+
+        before = extractor.extract_motion().copy()
+        extractor.update_delay_frames(2)
+        after = extractor.extract_motion()
+
+        assert after is not None
+        assert not np.array_equal(before, after)
+
+    def test_reset_clears_cached_result(self):
+        """Test that reset drops the cached frame."""
+        rng = np.random.default_rng(3)
+        extractor = MotionExtractor(delay_seconds=0.2, fps=30)
+        for _ in range(5):
+            extractor.add_frame(_random_frame(rng))
+
+        assert extractor.extract_motion() is not None
+        extractor.reset()
+        assert extractor.extract_motion() is None
+
+
+class TestAddFrameConstant:
+    """Test suite for allocation-free constant-frame ingest."""
+
+    def test_matches_real_constant_frame(self):
+        """Test equivalence with ingesting an actual constant frame."""
+        rng = np.random.default_rng(4)
+        frame = _random_frame(rng)
+
+        with_fill = MotionExtractor(delay_seconds=0.1, fps=30)
+        with_fill.add_frame(frame)
+        with_fill.add_frame_constant(0)
+
+        with_array = MotionExtractor(delay_seconds=0.1, fps=30)
+        with_array.add_frame(frame)
+        with_array.add_frame(np.zeros_like(frame))
+
+        assert np.array_equal(with_fill.extract_motion(),
+                              with_array.extract_motion())
+
+    def test_requires_a_real_frame_first(self):
+        """Test that the fill fails before any frame sets the shape."""
+        extractor = MotionExtractor(delay_seconds=0.1, fps=30)
+
+        with pytest.raises(ValueError):
+            extractor.add_frame_constant(0)
+
+    def test_rejects_out_of_range_values(self):
+        """Test the 0-255 range check."""
+        rng = np.random.default_rng(5)
+        extractor = MotionExtractor(delay_seconds=0.1, fps=30)
+        extractor.add_frame(_random_frame(rng))
+
+        with pytest.raises(ValueError):
+            extractor.add_frame_constant(256)
+        with pytest.raises(ValueError):
+            extractor.add_frame_constant(-1)
+
+
+class TestExtractMotionMulti:
+    """Test suite for multi-tap extraction."""
+
+    def test_rejects_mismatched_shapes(self):
+        """Test shape validation of the delayed stack and alphas."""
+        rng = np.random.default_rng(6)
+        current = _random_frame(rng)
+        stack = np.stack([_random_frame(rng) for _ in range(2)])
+
+        with pytest.raises(ValueError):
+            extract_motion_multi(current, stack[:, :10], [0.5, 0.5])
+        with pytest.raises(ValueError):
+            extract_motion_multi(current, stack, [0.5])
+        with pytest.raises(ValueError):
+            extract_motion_multi(current, stack, [0.5, 0.5],
+                                 out=np.empty_like(current))
+
+    def test_output_shape_and_reuse(self):
+        """Test the output stack shape and out= reuse."""
+        rng = np.random.default_rng(7)
+        current = _random_frame(rng)
+        stack = np.stack([_random_frame(rng) for _ in range(3)])
+        out = np.empty_like(stack)
+
+        result = extract_motion_multi(current, stack, [0.5, 0.3, 0.8], out=out)
+
+        assert result is out
+        assert result.shape == stack.shape
+
+    def test_numba_and_opencv_tiers_agree(self):
+        """Test the cv2 fallback against the fused kernel within rounding."""
+        if not motion_kernels.HAVE_NUMBA:
+            pytest.skip("numba not installed; only one tier available")
+
+        rng = np.random.default_rng(8)
+        current = _random_frame(rng)
+        stack = np.stack([_random_frame(rng) for _ in range(2)])
+        alphas = [0.5, 0.7]
+
+        fused = extract_motion_multi(current, stack, alphas)
+        motion_kernels.HAVE_NUMBA = False
+        try:
+            fallback = extract_motion_multi(current, stack, alphas)
+        finally:
+            motion_kernels.HAVE_NUMBA = True
+
+        difference = np.abs(fused.astype(int) - fallback.astype(int))
+        assert difference.max() <= 2
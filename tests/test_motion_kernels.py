@@ -0,0 +1,83 @@
+"""
+Unit tests for the standalone Numba kernels against their OpenCV
+reference implementations.
+"""
+
+import pytest
+import cv2
+import numpy as np
+from src import motion_kernels
+
+pytestmark = pytest.mark.skipif(
+    not motion_kernels.HAVE_NUMBA, reason="numba not installed"
+)
+
+
+class TestThresholdMaskSwar:
+    """Test suite for the SWAR byte threshold."""
+
+    @pytest.mark.parametrize("thresh", [0, 1, 25, 64, 126, 127])
+    def test_matches_cv2_threshold(self, thresh):
+        """Test bit-exactness against cv2.threshold over random images."""
+        rng = np.random.default_rng(thresh)
+        gray = rng.integers(0, 256, (33, 47), dtype=np.uint8)
+        out = np.empty_like(gray)
+
+        motion_kernels.threshold_mask_swar(gray, thresh, out)
+        _, expected = cv2.threshold(gray, thresh, 255, cv2.THRESH_BINARY)
+
+        assert np.array_equal(out, expected)
+
+    @pytest.mark.parametrize("size", [0, 1, 7, 8, 9, 64, 1000])
+    def test_scalar_tail(self, size):
+        """Test sizes around the 8-byte word boundary, including the tail."""
+        rng = np.random.default_rng(size)
+        gray = rng.integers(0, 256, size, dtype=np.uint8)
+        out = np.empty_like(gray)
+
+        motion_kernels.threshold_mask_swar(gray, 25, out)
+
+        assert np.array_equal(out, np.where(gray > 25, 255, 0))
+
+    def test_rejects_thresh_out_of_range(self):
+        """Test the 0-127 range check."""
+        gray = np.zeros(16, dtype=np.uint8)
+        out = np.empty_like(gray)
+
+        with pytest.raises(ValueError):
+            motion_kernels.threshold_mask_swar(gray, 128, out)
+        with pytest.raises(ValueError):
+            motion_kernels.threshold_mask_swar(gray, -1, out)
+
+
+class TestBlendInvertAvg:
+    """Test suite for the fused invert-and-average blend."""
+
+    def test_matches_cv2_add_weighted(self):
+        """Test against addWeighted with the inverted operand, within 1 LSB.
+
+        The byte-average idiom rounds halves up while cvRound rounds them
+        to even, so exact equality is not expected on odd sums.
+        """
+        rng = np.random.default_rng(0)
+        current = rng.integers(0, 256, (33, 47, 3), dtype=np.uint8)
+        delayed = rng.integers(0, 256, (33, 47, 3), dtype=np.uint8)
+        out = np.empty_like(current)
+
+        motion_kernels.blend_invert_avg(current, delayed, out)
+        expected = cv2.addWeighted(
+            current, 0.5, cv2.bitwise_not(delayed), 0.5, 0
+        )
+
+        difference = np.abs(out.astype(int) - expected.astype(int))
+        assert difference.max() <= 1
+
+    def test_exact_on_even_sums(self):
+        """Test exactness where no half needs rounding."""
+        current = np.full((8, 8, 3), 100, dtype=np.uint8)
+        delayed = np.full((8, 8, 3), 55, dtype=np.uint8)  # 100 + 200 even
+        out = np.empty_like(current)
+
+        motion_kernels.blend_invert_avg(current, delayed, out)
+
+        assert np.all(out == 150)